@@ -1,8 +1,32 @@
 """Vultr DNS Updater - Dynamic DNS updater for Vultr DNS service."""
 
-from vultr_dns_updater.config import Config
-from vultr_dns_updater.ip_service import get_public_ip
-from vultr_dns_updater.vultr_client import VultrClient
+from __future__ import annotations
 
-__all__ = ["Config", "VultrClient", "get_public_ip"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vultr_dns_updater.config import Config
+    from vultr_dns_updater.ip_service import get_public_ip
+    from vultr_dns_updater.vultr_client import AsyncVultrClient, VultrClient
+
+__all__ = ["AsyncVultrClient", "Config", "VultrClient", "get_public_ip"]
 __version__ = "0.1.0"
+
+# Public name -> defining module; resolved on first access so that importing
+# the CLI doesn't pull in msgspec/httpx for commands that don't need them
+_LAZY_EXPORTS = {
+    "AsyncVultrClient": "vultr_dns_updater.vultr_client",
+    "Config": "vultr_dns_updater.config",
+    "VultrClient": "vultr_dns_updater.vultr_client",
+    "get_public_ip": "vultr_dns_updater.ip_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
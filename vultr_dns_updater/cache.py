@@ -0,0 +1,207 @@
+"""Best-effort JSON state files in the user's cache directory."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, TypeGuard
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "vultr-dns-updater"
+
+DNS_STATE_FILE = "state.json"
+DNS_STATE_TTL = 300.0
+
+PUBLIC_IP_FILE = "ip.json"
+PUBLIC_IP_TTL = 60.0
+
+
+def read_json(name: str) -> dict[str, Any] | None:
+    """
+    Read a JSON object from the cache directory.
+
+    Args:
+        name: File name inside the cache directory
+
+    Returns:
+        The decoded object, or None if missing or unreadable
+    """
+    return read_json_file(CACHE_DIR / name)
+
+
+def write_json(name: str, data: dict[str, Any]) -> None:
+    """
+    Atomically write a JSON object to the cache directory.
+
+    Args:
+        name: File name inside the cache directory
+        data: JSON-serializable object to store
+    """
+    write_json_file(CACHE_DIR / name, data)
+
+
+def read_json_file(path: Path) -> dict[str, Any] | None:
+    """
+    Read a JSON object from a file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        The decoded object, or None if missing or unreadable
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def write_json_file(path: Path, data: dict[str, Any]) -> None:
+    """
+    Atomically write a JSON object to a file.
+
+    The file is written to a temporary sibling and moved into place with
+    os.replace, so readers never see a partial file. Errors are ignored since
+    the cache is only an optimization.
+
+    Args:
+        path: Path of the file; missing parent directories are created
+        data: JSON-serializable object to store
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_name, path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def _is_fresh(timestamp: object, max_age: float) -> TypeGuard[float]:
+    """
+    Check that a time.time() timestamp is at most max_age seconds old.
+
+    A timestamp in the future means the clock stepped backwards since it was
+    written, so it is treated as expired rather than as fresh.
+    """
+    if not isinstance(timestamp, int | float):
+        return False
+    return 0 <= time.time() - timestamp < max_age
+
+
+def read_fresh_json(name: str, max_age: float) -> dict[str, Any] | None:
+    """
+    Read a JSON object written by write_fresh_json, if it isn't too old.
+
+    Args:
+        name: File name inside the cache directory
+        max_age: Maximum age of the stored object in seconds
+
+    Returns:
+        The decoded object, or None if missing, unreadable or expired
+    """
+    data = read_json(name)
+    if data is None:
+        return None
+
+    return data if _is_fresh(data.get("ts"), max_age) else None
+
+
+def write_fresh_json(name: str, data: dict[str, Any]) -> None:
+    """
+    Atomically write a JSON object stamped with the current time.
+
+    Args:
+        name: File name inside the cache directory
+        data: JSON-serializable object to store
+    """
+    write_json(name, {**data, "ts": time.time()})
+
+
+def _is_dns_state_entry(entry: object) -> bool:
+    """Check that a stored record is None or {"id": str, "data": str, "ttl": int}."""
+    if entry is None:
+        return True
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("id"), str)
+        and isinstance(entry.get("data"), str)
+        and isinstance(entry.get("ttl"), int)
+    )
+
+
+def _fresh_dns_state(
+    public_ip: str, max_age: float
+) -> tuple[dict[str, dict[str, Any] | None], dict[str, float]]:
+    """
+    Read the valid, unexpired DNS state entries recorded for public_ip.
+
+    Malformed or expired entries are dropped, as if they had never been
+    cached.
+
+    Returns:
+        Tuple of (FQDN -> record, FQDN -> time.time() the record was checked)
+    """
+    state = read_json(DNS_STATE_FILE)
+    if not state or state.get("public_ip") != public_ip:
+        return {}, {}
+
+    records = state.get("records")
+    checked = state.get("checked")
+    if not isinstance(records, dict) or not isinstance(checked, dict):
+        return {}, {}
+
+    fresh: dict[str, dict[str, Any] | None] = {}
+    fresh_checked: dict[str, float] = {}
+    for fqdn, entry in records.items():
+        timestamp = checked.get(fqdn)
+        if not _is_fresh(timestamp, max_age) or not _is_dns_state_entry(entry):
+            continue
+        fresh[fqdn] = entry
+        fresh_checked[fqdn] = timestamp
+    return fresh, fresh_checked
+
+
+def load_dns_state(
+    public_ip: str, max_age: float = DNS_STATE_TTL
+) -> dict[str, dict[str, Any] | None]:
+    """
+    Load the DNS records seen recently for the same IP.
+
+    Args:
+        public_ip: The current public IP address
+        max_age: Maximum age of a recorded record in seconds
+
+    Returns:
+        Mapping of FQDN to {"id", "data", "ttl"} (None if the record did not
+        exist); FQDNs without a usable entry are left out
+    """
+    return _fresh_dns_state(public_ip, max_age)[0]
+
+
+def save_dns_state(public_ip: str, records: dict[str, dict[str, Any] | None]) -> None:
+    """
+    Save the DNS records seen for the current public IP.
+
+    Records are merged into those already saved for the same IP, so checking
+    a subset of the targets keeps the others cached.
+
+    Args:
+        public_ip: The public IP address the records were checked against
+        records: Mapping of FQDN to {"id", "data", "ttl"}, or None if missing
+    """
+    merged, checked = _fresh_dns_state(public_ip, DNS_STATE_TTL)
+    now = time.time()
+    for fqdn, entry in records.items():
+        merged[fqdn] = entry
+        checked[fqdn] = now
+    write_json(DNS_STATE_FILE, {"public_ip": public_ip, "records": merged, "checked": checked})
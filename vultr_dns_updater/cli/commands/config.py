@@ -25,7 +25,7 @@ def init_config(path: Path | None) -> None:
     try:
         Config.create_example_config(config_path)
         print_success(f"Created example config at: {config_path}")
-        console.print("\n[dim]Edit the file to add your Vultr API key and targets.[/dim]")
+        console().print("\n[dim]Edit the file to add your Vultr API key and targets.[/dim]")
     except ConfigError as e:
         print_error(str(e))
         raise SystemExit(1) from e
@@ -34,4 +34,4 @@ def init_config(path: Path | None) -> None:
 @click.command()
 def show_config_example() -> None:
     """Show the example configuration file content."""
-    console.print(Config.get_example_config())
+    console().print(Config.get_example_config())
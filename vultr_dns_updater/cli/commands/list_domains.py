@@ -7,23 +7,10 @@ from pathlib import Path
 import click
 from rich.table import Table
 
-from vultr_dns_updater.cli.utils import console, print_error, print_info
-from vultr_dns_updater.config import Config, ConfigError
+from vultr_dns_updater.cli.utils import console, print_error, print_info, resolve_api_key
 from vultr_dns_updater.vultr_client import VultrAPIError, VultrClient
 
 
-def _resolve_api_key(config_path: Path | None, api_key: str | None) -> str | None:
-    """Resolve API key from various sources."""
-    if api_key:
-        return api_key
-
-    try:
-        config = Config.find_and_load(config_path)
-        return config.api_key
-    except ConfigError:
-        return None
-
-
 @click.command()
 @click.option(
     "--config",
@@ -40,7 +27,7 @@ def _resolve_api_key(config_path: Path | None, api_key: str | None) -> str | Non
 )
 def list_domains(config_path: Path | None, api_key: str | None) -> None:
     """List all DNS domains in your Vultr account."""
-    resolved_api_key = _resolve_api_key(config_path, api_key)
+    resolved_api_key, _ = resolve_api_key(config_path, api_key)
     if not resolved_api_key:
         print_error("No API key provided. Use --api-key or set VULTR_API_KEY")
         raise SystemExit(1)
@@ -60,7 +47,7 @@ def list_domains(config_path: Path | None, api_key: str | None) -> None:
         for domain in domains:
             table.add_row(domain.domain, domain.date_created)
 
-        console.print(table)
+        console().print(table)
 
     except VultrAPIError as e:
         print_error(str(e))
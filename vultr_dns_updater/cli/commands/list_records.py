@@ -7,23 +7,10 @@ from pathlib import Path
 import click
 from rich.table import Table
 
-from vultr_dns_updater.cli.utils import console, print_error, print_info
-from vultr_dns_updater.config import Config, ConfigError
+from vultr_dns_updater.cli.utils import console, print_error, print_info, resolve_api_key
 from vultr_dns_updater.vultr_client import VultrAPIError, VultrClient
 
 
-def _resolve_api_key(config_path: Path | None, api_key: str | None) -> str | None:
-    """Resolve API key from various sources."""
-    if api_key:
-        return api_key
-
-    try:
-        config = Config.find_and_load(config_path)
-        return config.api_key
-    except ConfigError:
-        return None
-
-
 @click.command()
 @click.argument("domain")
 @click.option(
@@ -41,38 +28,37 @@ def _resolve_api_key(config_path: Path | None, api_key: str | None) -> str | Non
 )
 def list_records(domain: str, config_path: Path | None, api_key: str | None) -> None:
     """List all DNS records for a domain."""
-    resolved_api_key = _resolve_api_key(config_path, api_key)
+    resolved_api_key, _ = resolve_api_key(config_path, api_key)
     if not resolved_api_key:
         print_error("No API key provided. Use --api-key or set VULTR_API_KEY")
         raise SystemExit(1)
 
+    table = Table(title=f"DNS Records for {domain}")
+    table.add_column("ID", style="dim", no_wrap=True)
+    table.add_column("Type", style="cyan", no_wrap=True)
+    table.add_column("Name", style="green")
+    table.add_column("Data", style="yellow")
+    table.add_column("TTL", style="dim", no_wrap=True)
+    table.add_column("Priority", style="dim", no_wrap=True)
+
     try:
         with VultrClient(resolved_api_key) as client:
-            records = client.list_records(domain)
+            # Rows are added page by page as the records are received
+            for record in client.iter_records(domain):
+                table.add_row(
+                    record.id,
+                    record.type,
+                    record.name or "@",
+                    record.data,
+                    str(record.ttl),
+                    str(record.priority),
+                )
 
-        if not records:
+        if not table.row_count:
             print_info(f"No records found for domain: {domain}")
             return
 
-        table = Table(title=f"DNS Records for {domain}")
-        table.add_column("ID", style="dim")
-        table.add_column("Type", style="cyan")
-        table.add_column("Name", style="green")
-        table.add_column("Data", style="yellow")
-        table.add_column("TTL", style="dim")
-        table.add_column("Priority", style="dim")
-
-        for record in records:
-            table.add_row(
-                record.id,
-                record.type,
-                record.name or "@",
-                record.data,
-                str(record.ttl),
-                str(record.priority),
-            )
-
-        console.print(table)
+        console().print(table)
 
     except VultrAPIError as e:
         print_error(str(e))
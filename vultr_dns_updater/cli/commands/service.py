@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import shlex
 import shutil
 import subprocess
 import sys
 import tempfile
+from importlib import resources
 from pathlib import Path
 
 import click
@@ -18,15 +21,18 @@ SERVICE_NAME = "vultr-dns-updater"
 SYSTEMD_DIR = Path("/etc/systemd/system")
 
 
+@functools.cache
 def _get_vultr_dns_executable() -> str:
     """Get the absolute path to the vultr-dns executable."""
+    # The script next to the running interpreter (venv, pipx, uv tool) is the
+    # common case and costs a single stat, so check it before walking PATH
+    venv_script = Path(sys.executable).parent / "vultr-dns"
+    if venv_script.is_file():
+        return os.fspath(venv_script)
+
     vultr_dns_path = shutil.which("vultr-dns")
     if vultr_dns_path:
-        return str(Path(vultr_dns_path).resolve())
-
-    venv_script = Path(sys.executable).parent / "vultr-dns"
-    if venv_script.exists():
-        return str(venv_script.resolve())
+        return os.fspath(Path(vultr_dns_path).resolve())
 
     return f"{Path(sys.executable).resolve()} -m vultr_dns_updater.cli"
 
@@ -37,48 +43,26 @@ def _run_sudo(args: list[str], capture: bool = False) -> subprocess.CompletedPro
     return subprocess.run(cmd, capture_output=capture, text=True, check=False)
 
 
-def _run_systemctl(
-    args: list[str], use_sudo: bool = False, capture: bool = False
-) -> subprocess.CompletedProcess[str]:
-    """Run systemctl command, optionally with sudo."""
-    if use_sudo:
-        return _run_sudo(["systemctl", *args], capture=capture)
-    cmd = ["systemctl", *args]
-    return subprocess.run(cmd, capture_output=capture, text=True, check=False)
-
+def _shell_chain(*steps: list[str]) -> str:
+    """Join commands into a shell script that stops at the first failure."""
+    return " && ".join(shlex.join(step) for step in steps)
 
-def _generate_service_file(username: str, config_path: Path, executable: str) -> str:
-    """Generate systemd service file content."""
-    return f"""\
-[Unit]
-Description=Vultr DNS Updater
-After=network-online.target
-Wants=network-online.target
 
-[Service]
-Type=oneshot
-User={username}
-ExecStart={executable} update --config {config_path}
+def _run_sudo_script(script: str) -> subprocess.CompletedProcess[str]:
+    """Run a shell script with a single sudo invocation."""
+    return _run_sudo(["sh", "-c", script])
 
-[Install]
-WantedBy=multi-user.target
-"""
 
+def _run_systemctl(args: list[str], capture: bool = False) -> subprocess.CompletedProcess[str]:
+    """Run systemctl command."""
+    cmd = ["systemctl", *args]
+    return subprocess.run(cmd, capture_output=capture, text=True, check=False)
 
-def _generate_timer_file(interval: int) -> str:
-    """Generate systemd timer file content."""
-    return f"""\
-[Unit]
-Description=Run Vultr DNS Updater every {interval} minutes
-
-[Timer]
-OnBootSec=1min
-OnUnitActiveSec={interval}min
-Persistent=true
 
-[Install]
-WantedBy=timers.target
-"""
+def _render_unit(filename: str, **values: object) -> str:
+    """Render a systemd unit template shipped in vultr_dns_updater/systemd/."""
+    template = resources.files("vultr_dns_updater").joinpath("systemd", filename).read_text()
+    return template.format(**values)
 
 
 @click.group()
@@ -106,19 +90,8 @@ def install(interval: int) -> None:
         raise SystemExit(1)
 
     try:
-        Config.find_and_load()
-        config_path = None
-        for path in [
-            Path.home() / ".config" / "vultr-dns-updater" / "config.toml",
-            Path.home() / ".vultr-dns-updater.toml",
-            Path("vultr-dns-updater.toml"),
-        ]:
-            if path.exists():
-                config_path = path.resolve()
-                break
-        if not config_path:
-            raise ConfigError("Config file not found")
-        config = Config.find_and_load()
+        config_path = Config.get_required_config_path().resolve()
+        config = Config.from_file(config_path)
         if not config.targets:
             print_error("No targets configured. Add targets to your config file first.")
             raise SystemExit(1)
@@ -130,63 +103,55 @@ def install(interval: int) -> None:
     service_file = SYSTEMD_DIR / f"{SERVICE_NAME}.service"
     timer_file = SYSTEMD_DIR / f"{SERVICE_NAME}.timer"
 
-    console.print(f"\n[bold]Installing {SERVICE_NAME} service...[/bold]\n")
-    console.print(f"  User: [cyan]{username}[/cyan]")
-    console.print(f"  Config: [cyan]{config_path}[/cyan]")
-    console.print(f"  Executable: [cyan]{executable}[/cyan]")
-    console.print(f"  Interval: [cyan]{interval} minutes[/cyan]\n")
-
-    service_content = _generate_service_file(username, config_path, executable)
-    timer_content = _generate_timer_file(interval)
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".service", delete=False) as f:
-        f.write(service_content)
-        temp_service = f.name
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".timer", delete=False) as f:
-        f.write(timer_content)
-        temp_timer = f.name
-
-    console.print("[dim]sudo password may be required...[/dim]\n")
-
-    result = _run_sudo(["cp", temp_service, str(service_file)])
-    Path(temp_service).unlink()
-    if result.returncode != 0:
-        Path(temp_timer).unlink()
-        print_error("Failed to install service file. Is sudo available?")
-        raise SystemExit(1)
-    console.print(f"  Created: {service_file}")
-
-    result = _run_sudo(["cp", temp_timer, str(timer_file)])
-    Path(temp_timer).unlink()
+    console().print(f"\n[bold]Installing {SERVICE_NAME} service...[/bold]\n")
+    console().print(f"  User: [cyan]{username}[/cyan]")
+    console().print(f"  Config: [cyan]{config_path}[/cyan]")
+    console().print(f"  Executable: [cyan]{executable}[/cyan]")
+    console().print(f"  Interval: [cyan]{interval} minutes[/cyan]\n")
+
+    service_content = _render_unit(
+        f"{SERVICE_NAME}.service",
+        username=username,
+        config_path=config_path,
+        executable=executable,
+    )
+    timer_content = _render_unit(f"{SERVICE_NAME}.timer", interval=interval)
+
+    console().print("[dim]sudo password may be required...[/dim]\n")
+
+    # Stage both units together so a single install(1) call moves them in
+    with tempfile.TemporaryDirectory() as staging_dir:
+        staged_service = Path(staging_dir, service_file.name)
+        staged_timer = Path(staging_dir, timer_file.name)
+        staged_service.write_text(service_content)
+        staged_timer.write_text(timer_content)
+
+        result = _run_sudo_script(
+            _shell_chain(
+                ["install", "-m", "644", str(staged_service), str(staged_timer), str(SYSTEMD_DIR)],
+                ["systemctl", "daemon-reload"],
+                ["systemctl", "enable", f"{SERVICE_NAME}.timer"],
+                ["systemctl", "start", f"{SERVICE_NAME}.timer"],
+            )
+        )
     if result.returncode != 0:
-        print_error("Failed to install timer file.")
+        print_error("Failed to install and start the service. Is sudo available?")
         raise SystemExit(1)
-    console.print(f"  Created: {timer_file}")
-
-    console.print("\n[bold]Enabling service...[/bold]\n")
 
-    _run_systemctl(["daemon-reload"], use_sudo=True)
-    console.print("  Reloaded systemd daemon")
+    console().print(f"  Created: {service_file}")
+    console().print(f"  Created: {timer_file}")
 
-    result = _run_systemctl(["enable", f"{SERVICE_NAME}.timer"], use_sudo=True)
-    if result.returncode != 0:
-        print_error("Failed to enable timer")
-        raise SystemExit(1)
-    console.print(f"  Enabled {SERVICE_NAME}.timer")
-
-    result = _run_systemctl(["start", f"{SERVICE_NAME}.timer"], use_sudo=True)
-    if result.returncode != 0:
-        print_error("Failed to start timer")
-        raise SystemExit(1)
-    console.print(f"  Started {SERVICE_NAME}.timer")
+    console().print("\n[bold]Enabling service...[/bold]\n")
+    console().print("  Reloaded systemd daemon")
+    console().print(f"  Enabled {SERVICE_NAME}.timer")
+    console().print(f"  Started {SERVICE_NAME}.timer")
 
     print_success(f"\nService installed! DNS will update every {interval} minutes.")
-    console.print(
+    console().print(
         f"\n[dim]The service runs as user '{username}' but is managed at system level.[/dim]"
     )
-    console.print(f"[dim]View logs:[/dim]  journalctl -u {SERVICE_NAME}.service")
-    console.print(f"[dim]Check timer:[/dim] systemctl list-timers {SERVICE_NAME}.timer")
+    console().print(f"[dim]View logs:[/dim]  journalctl -u {SERVICE_NAME}.service")
+    console().print(f"[dim]Check timer:[/dim] systemctl list-timers {SERVICE_NAME}.timer")
 
 
 @service.command()
@@ -199,31 +164,29 @@ def uninstall() -> None:
         print_info("No service installed. Nothing to uninstall.")
         return
 
-    console.print(f"\n[bold]Uninstalling {SERVICE_NAME} service...[/bold]\n")
-    console.print("[dim]sudo password may be required...[/dim]\n")
-
-    _run_systemctl(["stop", f"{SERVICE_NAME}.timer"], use_sudo=True)
-    console.print(f"  Stopped {SERVICE_NAME}.timer")
+    console().print(f"\n[bold]Uninstalling {SERVICE_NAME} service...[/bold]\n")
+    console().print("[dim]sudo password may be required...[/dim]\n")
 
-    _run_systemctl(["disable", f"{SERVICE_NAME}.timer"], use_sudo=True)
-    console.print(f"  Disabled {SERVICE_NAME}.timer")
+    installed = [path for path in (timer_file, service_file) if path.exists()]
 
-    if timer_file.exists():
-        result = _run_sudo(["rm", str(timer_file)])
-        if result.returncode != 0:
-            print_error(f"Failed to remove {timer_file}")
-            raise SystemExit(1)
-        console.print(f"  Removed: {timer_file}")
-
-    if service_file.exists():
-        result = _run_sudo(["rm", str(service_file)])
-        if result.returncode != 0:
-            print_error(f"Failed to remove {service_file}")
-            raise SystemExit(1)
-        console.print(f"  Removed: {service_file}")
+    # Stopping/disabling may fail if the timer is already gone; carry on anyway
+    result = _run_sudo_script(
+        shlex.join(["systemctl", "disable", "--now", f"{SERVICE_NAME}.timer"])
+        + "; "
+        + _shell_chain(
+            ["rm", "-f", *(str(path) for path in installed)],
+            ["systemctl", "daemon-reload"],
+        )
+    )
+    if result.returncode != 0:
+        print_error(f"Failed to remove {', '.join(str(path) for path in installed)}")
+        raise SystemExit(1)
 
-    _run_systemctl(["daemon-reload"], use_sudo=True)
-    console.print("  Reloaded systemd daemon")
+    console().print(f"  Stopped {SERVICE_NAME}.timer")
+    console().print(f"  Disabled {SERVICE_NAME}.timer")
+    for path in installed:
+        console().print(f"  Removed: {path}")
+    console().print("  Reloaded systemd daemon")
 
     print_success("\nService uninstalled successfully.")
 
@@ -231,15 +194,22 @@ def uninstall() -> None:
 @service.command(name="status")
 def service_status() -> None:
     """Check the status of the systemd service and timer."""
-    console.print(f"\n[bold]{SERVICE_NAME} Timer Status:[/bold]\n")
+    console().print(f"\n[bold]{SERVICE_NAME} Timer Status:[/bold]\n")
 
-    result = _run_systemctl(["status", f"{SERVICE_NAME}.timer"], capture=True)
-    if result.returncode == 4:
+    # Cheap one-line probe first, so a missing unit isn't reported by systemctl
+    probe = _run_systemctl(
+        ["show", "--property=LoadState", "--value", f"{SERVICE_NAME}.timer"], capture=True
+    )
+    if probe.returncode != 0:
+        print_error(probe.stderr.strip() or "Failed to query systemd")
+        raise SystemExit(1)
+    if probe.stdout.strip() == "not-found":
         print_info("No service installed.\nInstall with: vultr-dns service install")
         return
 
-    console.print(result.stdout or result.stderr)
+    # systemctl writes straight to the terminal (with its own colors) instead
+    # of being captured, decoded and re-rendered by rich
+    _run_systemctl(["status", "--no-pager", f"{SERVICE_NAME}.timer"])
 
-    console.print("\n[bold]Scheduled Timers:[/bold]\n")
-    result = _run_systemctl(["list-timers", f"{SERVICE_NAME}.timer"], capture=True)
-    console.print(result.stdout or result.stderr)
+    console().print("\n[bold]Scheduled Timers:[/bold]\n")
+    _run_systemctl(["list-timers", "--no-pager", f"{SERVICE_NAME}.timer"])
@@ -7,25 +7,13 @@ from pathlib import Path
 import click
 from rich.table import Table
 
-from vultr_dns_updater.cli.utils import console, print_error
+from vultr_dns_updater.cache import load_dns_state, save_dns_state
+from vultr_dns_updater.cli.utils import cached_public_ip, console, print_error, resolve_api_key
 from vultr_dns_updater.config import Config, ConfigError
-from vultr_dns_updater.ip_service import get_public_ip
 from vultr_dns_updater.models import UpdateConfig
 from vultr_dns_updater.vultr_client import VultrAPIError, VultrClient
 
 
-def _resolve_api_key(config_path: Path | None, api_key: str | None) -> str | None:
-    """Resolve API key from various sources."""
-    if api_key:
-        return api_key
-
-    try:
-        config = Config.find_and_load(config_path)
-        return config.api_key
-    except ConfigError:
-        return None
-
-
 @click.command()
 @click.option(
     "--config",
@@ -50,11 +38,18 @@ def _resolve_api_key(config_path: Path | None, api_key: str | None) -> str | Non
     "-s",
     help="Subdomain to check",
 )
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Query Vultr even if the records were checked recently",
+)
 def status(
     config_path: Path | None,
     api_key: str | None,
     domain: str | None,
     subdomain: str | None,
+    force: bool,
 ) -> None:
     """Check the current status of DNS records vs public IP."""
     targets: list[UpdateConfig] = []
@@ -62,7 +57,7 @@ def status(
 
     if domain and subdomain:
         targets = [UpdateConfig(domain=domain, subdomain=subdomain)]
-        resolved_api_key = _resolve_api_key(config_path, api_key)
+        resolved_api_key, _ = resolve_api_key(config_path, api_key)
     else:
         try:
             config = Config.find_and_load(config_path)
@@ -84,37 +79,54 @@ def status(
         raise SystemExit(1)
 
     try:
-        current_ip = get_public_ip()
+        current_ip = cached_public_ip()
     except RuntimeError as e:
         print_error(str(e))
         raise SystemExit(1) from e
 
-    console.print(f"[bold]Current Public IP:[/bold] {current_ip}\n")
+    console().print(f"[bold]Current Public IP:[/bold] {current_ip}\n")
 
-    try:
-        with VultrClient(resolved_api_key) as client:
-            table = Table(title="DNS Record Status")
-            table.add_column("FQDN", style="cyan")
-            table.add_column("Current DNS", style="yellow")
-            table.add_column("Status", style="bold")
-
-            for target in targets:
-                existing = client.get_record_by_name(target.domain, target.subdomain, "A")
-
-                if existing:
-                    if existing.data == current_ip:
-                        status_str = "[green]Up to date[/green]"
-                    else:
-                        status_str = "[red]Needs update[/red]"
-                    dns_ip = existing.data
-                else:
-                    status_str = "[yellow]Not found[/yellow]"
-                    dns_ip = "-"
-
-                table.add_row(target.fqdn, dns_ip, status_str)
-
-            console.print(table)
-
-    except VultrAPIError as e:
-        print_error(str(e))
-        raise SystemExit(1) from e
+    # Recent results for the same IP are reused instead of re-querying Vultr
+    records = {} if force else load_dns_state(current_ip)
+    cached = all(target.fqdn in records for target in targets)
+    if not cached:
+        try:
+            with VultrClient(resolved_api_key) as client:
+                records = {}
+                for target in targets:
+                    existing = client.get_record_by_name(target.domain, target.subdomain, "A")
+                    records[target.fqdn] = (
+                        {"id": existing.id, "data": existing.data, "ttl": existing.ttl}
+                        if existing
+                        else None
+                    )
+        except VultrAPIError as e:
+            print_error(str(e))
+            raise SystemExit(1) from e
+        save_dns_state(current_ip, records)
+
+    table = Table(title="DNS Record Status")
+    table.add_column("FQDN", style="cyan")
+    table.add_column("Current DNS", style="yellow")
+    table.add_column("Status", style="bold")
+
+    for target in targets:
+        existing_state = records[target.fqdn]
+
+        if existing_state:
+            if existing_state["data"] == current_ip:
+                status_str = "[green]Up to date[/green]"
+            else:
+                status_str = "[red]Needs update[/red]"
+            dns_ip = existing_state["data"]
+        else:
+            status_str = "[yellow]Not found[/yellow]"
+            dns_ip = "-"
+
+        if cached:
+            status_str += " [dim](checked recently)[/dim]"
+        table.add_row(target.fqdn, dns_ip, status_str)
+
+    console().print(table)
+    if cached:
+        console().print("[dim]Use --force to query Vultr now.[/dim]")
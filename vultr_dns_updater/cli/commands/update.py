@@ -2,27 +2,28 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
 import click
-
-from vultr_dns_updater.cli.utils import console, print_error, print_info, print_success
+from rich.console import Console
+
+from vultr_dns_updater.cache import load_dns_state, save_dns_state
+from vultr_dns_updater.cli.utils import (
+    buffered_console,
+    cached_public_ip,
+    console,
+    print_error,
+    print_info,
+    print_success,
+    resolve_api_key,
+)
 from vultr_dns_updater.config import Config, ConfigError
-from vultr_dns_updater.ip_service import get_public_ip
 from vultr_dns_updater.models import UpdateConfig
 from vultr_dns_updater.vultr_client import VultrAPIError, VultrClient
 
-
-def _resolve_api_key(config_path: Path | None, api_key: str | None) -> str | None:
-    """Resolve API key from various sources."""
-    if api_key:
-        return api_key
-
-    try:
-        config = Config.find_and_load(config_path)
-        return config.api_key
-    except ConfigError:
-        return None
+MAX_WORKERS = 8
 
 
 def _process_target(
@@ -31,46 +32,72 @@ def _process_target(
     ip: str,
     force: bool,
     dry_run: bool,
-) -> None:
-    """Process a single DNS update target."""
-    fqdn = target.fqdn
-    console.print(f"\n[bold]Processing:[/bold] {fqdn}")
+    known: dict[str, Any] | None = None,
+    out: Console | None = None,
+) -> dict[str, Any] | None:
+    """
+    Process a single DNS update target.
+
+    Args:
+        client: Vultr API client
+        target: The target to update
+        ip: The IP address the record should point to
+        force: Update even if the record already matches
+        dry_run: Only report what would be done
+        known: Recently recorded state of the target's record, if any
+        out: Console to write progress to (default: stdout console)
+
+    Returns:
+        The record's state after processing, or None if it doesn't exist
+    """
+    out = out or console()
+    fqdn, domain, subdomain, ttl = target.fqdn, target.domain, target.subdomain, target.ttl
+    out.print(f"\n[bold]Processing:[/bold] {fqdn}")
 
-    existing = client.get_record_by_name(target.domain, target.subdomain, "A")
+    if known and known["data"] == ip and known["ttl"] == ttl and not force:
+        out.print(f"  Current: {ip} (TTL: {ttl}, checked recently)")
+        print_info(f"  {fqdn} is already up to date", out)
+        return known
+
+    existing = client.get_record_by_name(domain, subdomain, "A")
 
     if existing:
-        console.print(f"  Current: {existing.data} (TTL: {existing.ttl})")
+        record_id, current_data, current_ttl = existing.id, existing.data, existing.ttl
+        out.print(f"  Current: {current_data} (TTL: {current_ttl})")
+        existing_state = {"id": record_id, "data": current_data, "ttl": current_ttl}
 
-        if existing.data == ip and existing.ttl == target.ttl and not force:
-            print_info(f"  {fqdn} is already up to date")
-            return
+        if current_data == ip and current_ttl == ttl and not force:
+            print_info(f"  {fqdn} is already up to date", out)
+            return existing_state
 
         if dry_run:
-            console.print(f"  [yellow]Would update:[/yellow] {existing.data} -> {ip}")
-            return
+            out.print(f"  [yellow]Would update:[/yellow] {current_data} -> {ip}")
+            return existing_state
 
         client.update_record(
-            domain=target.domain,
-            record_id=existing.id,
+            domain=domain,
+            record_id=record_id,
             data=ip,
-            ttl=target.ttl,
+            ttl=ttl,
         )
-        print_success(f"  Updated {fqdn}: {existing.data} -> {ip}")
-    else:
-        console.print("  Current: [dim]No record exists[/dim]")
+        print_success(f"  Updated {fqdn}: {current_data} -> {ip}", out)
+        return {"id": record_id, "data": ip, "ttl": ttl}
 
-        if dry_run:
-            console.print(f"  [yellow]Would create:[/yellow] {target.subdomain} A {ip}")
-            return
+    out.print("  Current: [dim]No record exists[/dim]")
 
-        client.create_record(
-            domain=target.domain,
-            name=target.subdomain,
-            data=ip,
-            record_type="A",
-            ttl=target.ttl,
-        )
-        print_success(f"  Created {fqdn} -> {ip}")
+    if dry_run:
+        out.print(f"  [yellow]Would create:[/yellow] {subdomain} A {ip}")
+        return None
+
+    created = client.create_record(
+        domain=domain,
+        name=subdomain,
+        data=ip,
+        record_type="A",
+        ttl=ttl,
+    )
+    print_success(f"  Created {fqdn} -> {ip}", out)
+    return {"id": created.id, "data": created.data, "ttl": created.ttl}
 
 
 @click.command()
@@ -139,7 +166,7 @@ def update(
 
     if domain and subdomain:
         targets = [UpdateConfig(domain=domain, subdomain=subdomain, ttl=ttl)]
-        resolved_api_key = _resolve_api_key(config_path, api_key)
+        resolved_api_key, _ = resolve_api_key(config_path, api_key)
     else:
         try:
             config = Config.find_and_load(config_path)
@@ -167,25 +194,54 @@ def update(
         print_info(f"Using custom IP: {current_ip}")
     else:
         try:
-            current_ip = get_public_ip()
+            current_ip = cached_public_ip()
             print_info(f"Current public IP: {current_ip}")
         except RuntimeError as e:
             print_error(str(e))
             raise SystemExit(1) from e
 
     if dry_run:
-        console.print("\n[bold yellow]DRY RUN MODE - No changes will be made[/bold yellow]\n")
-
-    try:
-        with VultrClient(resolved_api_key) as client:
-            for target in targets:
-                _process_target(
-                    client=client,
-                    target=target,
-                    ip=current_ip,
-                    force=force,
-                    dry_run=dry_run,
-                )
-    except VultrAPIError as e:
-        print_error(str(e))
-        raise SystemExit(1) from e
+        console().print("\n[bold yellow]DRY RUN MODE - No changes will be made[/bold yellow]\n")
+
+    # Records confirmed recently for this IP don't need to be fetched again
+    known = {} if force else load_dns_state(current_ip)
+    records: dict[str, dict[str, Any] | None] = {}
+
+    # Targets are independent, so process them concurrently. Each one renders
+    # into its own buffer, which is printed in config order once it's done.
+    outputs = [buffered_console() for _ in targets]
+    first_error: BaseException | None = None
+
+    with (
+        VultrClient(resolved_api_key) as client,
+        ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(targets))) as pool,
+    ):
+        futures = [
+            pool.submit(
+                _process_target,
+                client=client,
+                target=target,
+                ip=current_ip,
+                force=force,
+                dry_run=dry_run,
+                known=known.get(target.fqdn),
+                out=out,
+            )
+            for target, (out, _) in zip(targets, outputs, strict=True)
+        ]
+        for target, (_, buffer), future in zip(targets, outputs, futures, strict=True):
+            error = future.exception()
+            console().file.write(buffer.getvalue())
+            console().file.flush()
+            if error is None:
+                records[target.fqdn] = future.result()
+            elif first_error is None:
+                first_error = error
+
+    save_dns_state(current_ip, records)
+
+    if isinstance(first_error, VultrAPIError):
+        print_error(str(first_error))
+        raise SystemExit(1) from first_error
+    if first_error is not None:
+        raise first_error
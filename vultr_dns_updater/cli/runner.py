@@ -2,33 +2,60 @@
 
 from __future__ import annotations
 
-import click
-
-from vultr_dns_updater.cli.commands.config import init_config, show_config_example
-from vultr_dns_updater.cli.commands.get_ip import get_ip
-from vultr_dns_updater.cli.commands.list_domains import list_domains
-from vultr_dns_updater.cli.commands.list_records import list_records
-from vultr_dns_updater.cli.commands.service import service
-from vultr_dns_updater.cli.commands.status import status
-from vultr_dns_updater.cli.commands.update import update
+import importlib
+from typing import Any
 
+import click
 
-@click.group()
+# Command name -> "module:attribute", imported only when the command is used
+LAZY_COMMANDS = {
+    "get-ip": "vultr_dns_updater.cli.commands.get_ip:get_ip",
+    "list-domains": "vultr_dns_updater.cli.commands.list_domains:list_domains",
+    "list-records": "vultr_dns_updater.cli.commands.list_records:list_records",
+    "status": "vultr_dns_updater.cli.commands.status:status",
+    "update": "vultr_dns_updater.cli.commands.update:update",
+    "init-config": "vultr_dns_updater.cli.commands.config:init_config",
+    "show-config-example": "vultr_dns_updater.cli.commands.config:show_config_example",
+    "service": "vultr_dns_updater.cli.commands.service:service",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on demand."""
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load_command(cmd_name)
+        return command
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import and cache the command registered under cmd_name."""
+        module_name, attr = self.lazy_commands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{module_name}:{attr} is not a click command")
+        self.add_command(command, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(package_name="vultr-dns-updater")
 def cli() -> None:
     """Vultr DNS Updater - Dynamic DNS for Vultr DNS service."""
 
 
-# Register commands
-cli.add_command(get_ip)
-cli.add_command(list_domains)
-cli.add_command(list_records)
-cli.add_command(status)
-cli.add_command(update)
-cli.add_command(init_config)
-cli.add_command(show_config_example)
-cli.add_command(service)
-
-
 if __name__ == "__main__":
     cli()
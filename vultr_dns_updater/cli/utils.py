@@ -2,27 +2,122 @@
 
 from __future__ import annotations
 
+import functools
+import io
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 
-console = Console()
-error_console = Console(stderr=True)
+from vultr_dns_updater.cache import (
+    PUBLIC_IP_FILE,
+    PUBLIC_IP_TTL,
+    read_fresh_json,
+    write_fresh_json,
+)
+
+if TYPE_CHECKING:
+    from vultr_dns_updater.config import Config
+
+
+@functools.cache
+def console() -> Console:
+    """Get the stdout console, created on first use."""
+    return Console()
+
+
+@functools.cache
+def error_console() -> Console:
+    """Get the stderr console, created on first use."""
+    return Console(stderr=True)
+
+
+def buffered_console() -> tuple[Console, io.StringIO]:
+    """
+    Create a console that renders into memory like the stdout console would.
+
+    Returns:
+        Tuple of (console, buffer holding its rendered output)
+    """
+    target = console()
+    buffer = io.StringIO()
+    return (
+        Console(
+            file=buffer,
+            force_terminal=target.is_terminal,
+            width=target.width,
+        ),
+        buffer,
+    )
 
 
 def print_error(message: str) -> None:
     """Print an error message to stderr."""
-    error_console.print(f"[bold red]Error:[/bold red] {message}")
+    error_console().print(f"[bold red]Error:[/bold red] {message}")
+
+
+def print_success(message: str, out: Console | None = None) -> None:
+    """Print a success message (to out, or the stdout console)."""
+    (out or console()).print(f"[bold green]Success:[/bold green] {message}")
+
+
+def print_info(message: str, out: Console | None = None) -> None:
+    """Print an info message (to out, or the stdout console)."""
+    (out or console()).print(f"[bold blue]Info:[/bold blue] {message}")
+
+
+def print_warning(message: str, out: Console | None = None) -> None:
+    """Print a warning message (to out, or the stdout console)."""
+    (out or console()).print(f"[bold yellow]Warning:[/bold yellow] {message}")
+
+
+def resolve_api_key(
+    config_path: Path | None, api_key: str | None
+) -> tuple[str | None, Config | None]:
+    """
+    Resolve API key from various sources.
+
+    Args:
+        config_path: Explicit config file path, if any
+        api_key: API key given on the command line or environment
+
+    Returns:
+        Tuple of (api_key, config). The config is only loaded when no API key
+        was given explicitly; either value may be None.
+    """
+    if api_key:
+        return api_key, None
+
+    # Imported here so commands that never touch the config skip loading it
+    from vultr_dns_updater.config import Config, ConfigError
+
+    try:
+        config = Config.find_and_load(config_path)
+    except ConfigError:
+        return None, None
+    return config.api_key, config
+
 
+def cached_public_ip(ttl: float = PUBLIC_IP_TTL) -> str:
+    """
+    Get the public IP, reusing a recent lookup from another invocation.
 
-def print_success(message: str) -> None:
-    """Print a success message."""
-    console.print(f"[bold green]Success:[/bold green] {message}")
+    Args:
+        ttl: How long a lookup stays valid, in seconds
 
+    Returns:
+        The public IP address as a string
 
-def print_info(message: str) -> None:
-    """Print an info message."""
-    console.print(f"[bold blue]Info:[/bold blue] {message}")
+    Raises:
+        RuntimeError: If all IP detection services fail
+    """
+    # Imported here so commands that never need the IP skip httpx
+    from vultr_dns_updater.ip_service import get_public_ip
 
+    cached = read_fresh_json(PUBLIC_IP_FILE, ttl)
+    if cached and isinstance(cached.get("ip"), str):
+        return str(cached["ip"])
 
-def print_warning(message: str) -> None:
-    """Print a warning message."""
-    console.print(f"[bold yellow]Warning:[/bold yellow] {message}")
+    ip = get_public_ip()
+    write_fresh_json(PUBLIC_IP_FILE, {"ip": ip})
+    return ip
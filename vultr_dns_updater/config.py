@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import functools
 import tomllib
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
-from pydantic import ValidationError
+import msgspec
 
 from vultr_dns_updater.models import AppConfig, UpdateConfig
 
+# Path.home() can fall back to a passwd lookup; resolve it once at import
+_HOME = Path.home()
+
 DEFAULT_CONFIG_PATHS = [
-    Path.home() / ".config" / "vultr-dns-updater" / "config.toml",
-    Path.home() / ".vultr-dns-updater.toml",
+    _HOME / ".config" / "vultr-dns-updater" / "config.toml",
+    _HOME / ".vultr-dns-updater.toml",
     Path("vultr-dns-updater.toml"),
 ]
 
+# Per-process cache of loaded configs, keyed by (resolved path, mtime in ns)
+_LOAD_CACHE: dict[tuple[Path, int], Config] = {}
+
 EXAMPLE_CONFIG = """\
 # Vultr DNS Updater Configuration
 # Place this file at ~/.config/vultr-dns-updater/config.toml
@@ -47,6 +56,16 @@ class ConfigError(Exception):
     """Configuration error."""
 
 
+@functools.cache
+def _toml_loads() -> Callable[[str], dict[str, Any]]:
+    """Get the TOML parser, preferring the Rust-backed rtoml when installed."""
+    try:
+        import rtoml
+    except ImportError:
+        return tomllib.loads
+    return rtoml.loads
+
+
 class Config:
     """Configuration manager for the application."""
 
@@ -88,21 +107,29 @@ class Config:
         Raises:
             ConfigError: If the file cannot be read or parsed
         """
-        if not path.exists():
-            raise ConfigError(f"Configuration file not found: {path}")
+        try:
+            key = (path.resolve(), path.stat().st_mtime_ns)
+        except FileNotFoundError as e:
+            raise ConfigError(f"Configuration file not found: {path}") from e
+
+        cached = _LOAD_CACHE.get(key)
+        if cached is not None:
+            return cached
 
         try:
-            with open(path, "rb") as f:
-                data = tomllib.load(f)
-        except tomllib.TOMLDecodeError as e:
+            data = _toml_loads()(path.read_text(encoding="utf-8"))
+        except ValueError as e:
+            # Covers tomllib.TOMLDecodeError, rtoml.TomlParsingError and bad UTF-8
             raise ConfigError(f"Invalid TOML in {path}: {e}") from e
 
         try:
-            config = AppConfig.model_validate(data)
-        except ValidationError as e:
+            config = msgspec.convert(data, type=AppConfig, strict=False)
+        except msgspec.ValidationError as e:
             raise ConfigError(f"Invalid configuration in {path}: {e}") from e
 
-        return cls(config)
+        loaded = cls(config)
+        _LOAD_CACHE[key] = loaded
+        return loaded
 
     @classmethod
     def find_and_load(cls, explicit_path: Path | None = None) -> Config:
@@ -121,9 +148,33 @@ class Config:
         if explicit_path:
             return cls.from_file(explicit_path)
 
-        for path in DEFAULT_CONFIG_PATHS:
-            if path.exists():
-                return cls.from_file(path)
+        return cls.from_file(cls.get_required_config_path())
+
+    @staticmethod
+    def get_default_config_path() -> Path:
+        """Get the default configuration file path."""
+        return DEFAULT_CONFIG_PATHS[0]
+
+    @staticmethod
+    @functools.cache
+    def get_found_config_path() -> Path | None:
+        """Get the first default configuration path that exists (searched once per process)."""
+        return next(filter(Path.is_file, DEFAULT_CONFIG_PATHS), None)
+
+    @staticmethod
+    def get_required_config_path() -> Path:
+        """
+        Get the first default configuration path that exists.
+
+        Returns:
+            Path of the configuration file
+
+        Raises:
+            ConfigError: If no configuration file is found
+        """
+        path = Config.get_found_config_path()
+        if path is not None:
+            return path
 
         searched = "\n".join(f"  - {p}" for p in DEFAULT_CONFIG_PATHS)
         raise ConfigError(
@@ -131,11 +182,6 @@ class Config:
             f"Create a config file with:\n  vultr-dns init-config"
         )
 
-    @staticmethod
-    def get_default_config_path() -> Path:
-        """Get the default configuration file path."""
-        return DEFAULT_CONFIG_PATHS[0]
-
     @staticmethod
     def create_example_config(path: Path) -> None:
         """
@@ -152,6 +198,7 @@ class Config:
 
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(EXAMPLE_CONFIG)
+        Config.get_found_config_path.cache_clear()
 
     @staticmethod
     def get_example_config() -> str:
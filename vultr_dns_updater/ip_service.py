@@ -2,27 +2,125 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import socket
+import struct
+import threading
+import time
+from collections.abc import Sequence
+
 import httpx
 
-DEFAULT_IP_CHECK_URLS = [
-    "https://api.ipify.org",
-    "https://ifconfig.me/ip",
-    "https://icanhazip.com",
-]
+from vultr_dns_updater.models import DEFAULT_IP_CHECK_URLS
+
+# STUN (RFC 5389) server asked first; a single UDP round trip, no TLS handshake
+DEFAULT_STUN_SERVER = "stun.l.google.com:19302"
+STUN_TIMEOUT = 1.0
+
+_STUN_MAGIC_COOKIE = 0x2112A442
+_STUN_BINDING_REQUEST = 0x0001
+_STUN_BINDING_SUCCESS = 0x0101
+_STUN_MAPPED_ADDRESS = 0x0001
+_STUN_XOR_MAPPED_ADDRESS = 0x0020
+_STUN_FAMILY_IPV4 = 0x01
+
+# Services a detection used: (STUN server or None, HTTPS URLs)
+IPCacheKey = tuple[str | None, tuple[str, ...]]
+
+# Detected IPs keyed by the services used, as (time.monotonic() of detection, ip)
+_ip_cache: dict[IPCacheKey, tuple[float, str]] = {}
+_ip_cache_lock = threading.Lock()
+
+
+def invalidate_ip_cache() -> None:
+    """Forget previously detected IPs so the next lookup hits the network."""
+    with _ip_cache_lock:
+        _ip_cache.clear()
+
+
+def _get_cached_ip(cache_key: IPCacheKey, cache_ttl: float) -> str | None:
+    """Get a previously detected IP if it is younger than cache_ttl seconds."""
+    with _ip_cache_lock:
+        cached = _ip_cache.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+        return cached[1]
+    return None
+
+
+def _store_cached_ip(cache_key: IPCacheKey, ip: str) -> None:
+    """Remember a detected IP."""
+    with _ip_cache_lock:
+        _ip_cache[cache_key] = (time.monotonic(), ip)
+
+
+def _detection_error(errors: list[str]) -> RuntimeError:
+    """Build the error raised when every IP detection service failed."""
+    return RuntimeError(
+        "Failed to detect public IP. Errors:\n" + "\n".join(f"  - {e}" for e in errors)
+    )
 
 
 def get_public_ip(
-    urls: list[str] | None = None,
+    urls: Sequence[str] | None = None,
     timeout: float = 10.0,
+    cache_ttl: float = 300.0,
+    stun_server: str | None = DEFAULT_STUN_SERVER,
 ) -> str:
     """
     Get the current public IP address.
 
-    Tries multiple services in order until one succeeds.
+    Asks the STUN server first (unless urls are given), then queries all
+    HTTPS services concurrently and returns the first valid answer (see
+    get_public_ip_async). Results are cached in-process for cache_ttl
+    seconds; see invalidate_ip_cache().
+
+    Args:
+        urls: URLs to try for IP detection (default: DEFAULT_IP_CHECK_URLS)
+        timeout: Request timeout in seconds
+        cache_ttl: How long a detected IP is reused, in seconds (0 disables)
+        stun_server: "host:port" of a STUN server to try first when no urls
+            are given (None disables)
+
+    Returns:
+        The public IP address as a string
+
+    Raises:
+        RuntimeError: If all IP detection services fail, or if called from a
+            running event loop (await get_public_ip_async there instead)
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(get_public_ip_async(urls, timeout, cache_ttl, stun_server))
+
+    # Probing here would block the caller's event loop
+    raise RuntimeError(
+        "get_public_ip() can't be called from a running event loop; "
+        "await get_public_ip_async() instead"
+    )
+
+
+async def get_public_ip_async(
+    urls: Sequence[str] | None = None,
+    timeout: float = 10.0,
+    cache_ttl: float = 300.0,
+    stun_server: str | None = DEFAULT_STUN_SERVER,
+) -> str:
+    """
+    Get the current public IP address, racing all services.
+
+    Unless urls are given, the STUN server is asked first, with a short
+    timeout. If it doesn't answer, all HTTPS services are queried at once;
+    the first valid answer wins and the remaining requests are cancelled, so
+    a slow service doesn't hold up the result.
 
     Args:
-        urls: List of URLs to try for IP detection
+        urls: URLs to try for IP detection (default: DEFAULT_IP_CHECK_URLS)
         timeout: Request timeout in seconds
+        cache_ttl: How long a detected IP is reused, in seconds (0 disables)
+        stun_server: "host:port" of a STUN server to try first when no urls
+            are given (None disables)
 
     Returns:
         The public IP address as a string
@@ -30,32 +128,143 @@ def get_public_ip(
     Raises:
         RuntimeError: If all IP detection services fail
     """
+    # Callers passing their own URLs asked for those services specifically
+    if urls:
+        stun_server = None
     check_urls = urls or DEFAULT_IP_CHECK_URLS
-    errors: list[str] = []
+    cache_key: IPCacheKey = (stun_server or None, tuple(check_urls))
+    cached = _get_cached_ip(cache_key, cache_ttl)
+    if cached is not None:
+        return cached
 
-    for url in check_urls:
+    failures: list[str] = []
+    if stun_server:
         try:
-            response = httpx.get(url, timeout=timeout, follow_redirects=True)
-            response.raise_for_status()
-            ip = response.text.strip()
-            # Basic validation - should be a valid IP
-            if _is_valid_ipv4(ip):
-                return ip
-            errors.append(f"{url}: Invalid IP format: {ip}")
-        except httpx.HTTPError as e:
-            errors.append(f"{url}: {e}")
+            stun_ip = await asyncio.to_thread(
+                _get_ip_via_stun, stun_server, min(timeout, STUN_TIMEOUT)
+            )
+        except OSError as e:
+            failures.append(f"stun:{stun_server}: {e}")
+        else:
+            _store_cached_ip(cache_key, stun_ip)
+            return stun_ip
 
-    raise RuntimeError(
-        "Failed to detect public IP. Errors:\n" + "\n".join(f"  - {e}" for e in errors)
-    )
+    errors: dict[str, str] = {}
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        tasks = [asyncio.create_task(_probe(client, url)) for url in check_urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                url, ip, error = await next_done
+                if ip is not None:
+                    _store_cached_ip(cache_key, ip)
+                    return ip
+                errors[url] = error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # Report failures in the order the URLs were given
+    failures.extend(f"{url}: {errors[url]}" for url in check_urls)
+    raise _detection_error(failures)
+
+
+async def _probe(client: httpx.AsyncClient, url: str) -> tuple[str, str | None, str]:
+    """
+    Query a single IP detection service.
+
+    Returns:
+        Tuple of (url, ip or None, error message if no valid IP)
+    """
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        return url, None, str(e)
+
+    ip = response.text.strip()
+    # Basic validation - should be a valid IP
+    if _is_valid_ipv4(ip):
+        return url, ip, ""
+    return url, None, f"Invalid IP format: {ip}"
+
+
+def _get_ip_via_stun(server: str, timeout: float) -> str:
+    """
+    Get the public IPv4 address as seen by a STUN server.
+
+    Sends a single RFC 5389 Binding Request over UDP and reads the
+    (XOR-)MAPPED-ADDRESS attribute of the response.
+
+    Resolving the server name counts against timeout, but a resolver that
+    hangs can't be interrupted; give an IP address as the host to avoid the
+    lookup entirely.
+
+    Args:
+        server: "host:port" of the STUN server
+        timeout: How long to wait for the whole exchange, in seconds
+
+    Returns:
+        The public IP address as a string
+
+    Raises:
+        OSError: If the server can't be reached or gives no usable answer
+    """
+    host, _, port = server.rpartition(":")
+    if not host or not port.isdigit():
+        raise OSError(f"Invalid STUN server address: {server}")
+    transaction_id = os.urandom(12)
+    request = struct.pack("!HHI12s", _STUN_BINDING_REQUEST, 0, _STUN_MAGIC_COOKIE, transaction_id)
+
+    deadline = time.monotonic() + timeout
+    address = socket.getaddrinfo(host, int(port), socket.AF_INET, socket.SOCK_DGRAM)[0][4]
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError(f"Resolving {host} took longer than {timeout}s")
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.settimeout(remaining)
+        sock.sendto(request, address)
+        response = sock.recv(2048)
+
+    if len(response) < 20:
+        raise OSError("Truncated STUN response")
+    msg_type, length, cookie, response_id = struct.unpack_from("!HHI12s", response)
+    if (
+        msg_type != _STUN_BINDING_SUCCESS
+        or cookie != _STUN_MAGIC_COOKIE
+        or response_id != transaction_id
+    ):
+        raise OSError("Unexpected STUN response")
+
+    mapped: str | None = None
+    offset, end = 20, min(20 + length, len(response))
+    while offset + 4 <= end:
+        attr_type, attr_length = struct.unpack_from("!HH", response, offset)
+        value = response[offset + 4 : offset + 4 + attr_length]
+        # Attribute values are padded to a multiple of 4 bytes
+        offset += 4 + (attr_length + 3) // 4 * 4
+
+        if len(value) < 8 or value[1] != _STUN_FAMILY_IPV4:
+            continue
+        (packed,) = struct.unpack_from("!I", value, 4)
+        if attr_type == _STUN_XOR_MAPPED_ADDRESS:
+            return socket.inet_ntoa(struct.pack("!I", packed ^ _STUN_MAGIC_COOKIE))
+        if attr_type == _STUN_MAPPED_ADDRESS:
+            mapped = socket.inet_ntoa(value[4:8])
+
+    if mapped is None:
+        raise OSError("No IPv4 mapped address in STUN response")
+    return mapped
 
 
 def _is_valid_ipv4(ip: str) -> bool:
     """Check if a string is a valid IPv4 address."""
-    parts = ip.split(".")
-    if len(parts) != 4:
-        return False
     try:
-        return all(0 <= int(part) <= 255 for part in parts)
-    except ValueError:
+        packed = socket.inet_aton(ip)
+    except (OSError, ValueError):  # ValueError: embedded NUL
         return False
+    # inet_aton also accepts shorthand, octal and hex forms; only take the
+    # canonical dotted-quad spelling
+    return socket.inet_ntoa(packed) == ip
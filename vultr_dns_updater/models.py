@@ -1,11 +1,23 @@
-"""Pydantic models for Vultr DNS API responses and configuration."""
+"""Models for Vultr DNS API responses and configuration."""
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+import sys
+from typing import Annotated
 
+import msgspec
 
-class DNSRecord(BaseModel):
+DEFAULT_IP_CHECK_URLS: tuple[str, ...] = tuple(
+    sys.intern(url)
+    for url in (
+        "https://api.ipify.org",
+        "https://ifconfig.me/ip",
+        "https://icanhazip.com",
+    )
+)
+
+
+class DNSRecord(msgspec.Struct, frozen=True):
     """A DNS record from Vultr API."""
 
     id: str
@@ -16,37 +28,52 @@ class DNSRecord(BaseModel):
     ttl: int
 
 
-class DNSRecordsResponse(BaseModel):
+class PaginationLinks(msgspec.Struct, frozen=True):
+    """Cursor links for a paginated Vultr API listing."""
+
+    next: str = ""
+    prev: str = ""
+
+
+class PaginationMeta(msgspec.Struct, frozen=True):
+    """Pagination metadata for a Vultr API listing."""
+
+    total: int = 0
+    links: PaginationLinks = msgspec.field(default_factory=PaginationLinks)
+
+
+class DNSRecordsResponse(msgspec.Struct, frozen=True):
     """Response from Vultr DNS records list endpoint."""
 
     records: list[DNSRecord]
+    meta: PaginationMeta = msgspec.field(default_factory=PaginationMeta)
 
 
-class DNSDomain(BaseModel):
+class DNSDomain(msgspec.Struct, frozen=True):
     """A DNS domain from Vultr API."""
 
     domain: str
     date_created: str
 
 
-class DNSDomainsResponse(BaseModel):
+class DNSDomainsResponse(msgspec.Struct, frozen=True):
     """Response from Vultr DNS domains list endpoint."""
 
     domains: list[DNSDomain]
 
 
-class DNSRecordResponse(BaseModel):
+class DNSRecordResponse(msgspec.Struct, frozen=True):
     """Response from create/update DNS record endpoint."""
 
     record: DNSRecord
 
 
-class UpdateConfig(BaseModel):
+class UpdateConfig(msgspec.Struct, frozen=True):
     """Configuration for a single DNS update target."""
 
-    domain: str = Field(description="Base domain (e.g., flipbit03.com)")
-    subdomain: str = Field(description="Subdomain to update (e.g., home)")
-    ttl: int = Field(default=60, description="TTL in seconds")
+    domain: Annotated[str, msgspec.Meta(description="Base domain (e.g., flipbit03.com)")]
+    subdomain: Annotated[str, msgspec.Meta(description="Subdomain to update (e.g., home)")]
+    ttl: Annotated[int, msgspec.Meta(description="TTL in seconds")] = 60
 
     @property
     def fqdn(self) -> str:
@@ -56,16 +83,18 @@ class UpdateConfig(BaseModel):
         return self.domain
 
 
-class AppConfig(BaseModel):
+def _default_ip_check_urls() -> list[str]:
+    """Get a fresh copy of the default IP detection URLs."""
+    return list(DEFAULT_IP_CHECK_URLS)
+
+
+class AppConfig(msgspec.Struct, frozen=True):
     """Main application configuration."""
 
-    api_key: str = Field(description="Vultr API key")
-    targets: list[UpdateConfig] = Field(default_factory=list, description="DNS update targets")
-    ip_check_urls: list[str] = Field(
-        default_factory=lambda: [
-            "https://api.ipify.org",
-            "https://ifconfig.me/ip",
-            "https://icanhazip.com",
-        ],
-        description="URLs to check public IP",
+    api_key: Annotated[str, msgspec.Meta(description="Vultr API key")]
+    targets: Annotated[list[UpdateConfig], msgspec.Meta(description="DNS update targets")] = (
+        msgspec.field(default_factory=list)
+    )
+    ip_check_urls: Annotated[list[str], msgspec.Meta(description="URLs to check public IP")] = (
+        msgspec.field(default_factory=_default_ip_check_urls)
     )
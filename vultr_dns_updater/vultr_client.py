@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import TYPE_CHECKING, Any
 
 import httpx
+import msgspec
 
+from vultr_dns_updater.cache import read_json_file, write_json_file
 from vultr_dns_updater.models import (
     DNSDomain,
     DNSDomainsResponse,
@@ -15,9 +21,24 @@ from vultr_dns_updater.models import (
 )
 
 if TYPE_CHECKING:
-    pass
+    from pathlib import Path
 
 VULTR_API_BASE = "https://api.vultr.com/v2"
+RECORDS_PER_PAGE = 500  # Largest page size the Vultr API accepts
+
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=10,
+    max_connections=20,
+    keepalive_expiry=30.0,
+)
+
+_records_decoder = msgspec.json.Decoder(DNSRecordsResponse)
+_domains_decoder = msgspec.json.Decoder(DNSDomainsResponse)
+_record_decoder = msgspec.json.Decoder(DNSRecordResponse)
+
+RecordIndex = dict[tuple[str, str], DNSRecord]
+# (domain, query params) of a records page
+RecordsPageKey = tuple[str, tuple[tuple[str, str | int], ...]]
 
 
 class VultrAPIError(Exception):
@@ -29,26 +50,129 @@ class VultrAPIError(Exception):
         super().__init__(f"Vultr API Error ({status_code}): {message}")
 
 
+def _check_response(response: httpx.Response) -> bytes:
+    """
+    Raise on API errors and return the raw response body.
+
+    The body is returned undecoded so callers can decode it straight into
+    models in a single pass.
+
+    Raises:
+        VultrAPIError: If the API returned an error status
+    """
+    if response.status_code >= 400:
+        try:
+            error_data = msgspec.json.decode(response.content)
+            message = error_data.get("error", response.text)
+        except Exception:
+            message = response.text
+        raise VultrAPIError(response.status_code, str(message))
+
+    if response.status_code == 204:  # No content
+        return b""
+
+    return response.content
+
+
+def _parse_records_page(content: bytes) -> tuple[list[DNSRecord], str]:
+    """
+    Parse one page of a records listing.
+
+    Returns:
+        Tuple of (records on the page, cursor of the next page or "")
+    """
+    parsed = _records_decoder.decode(content)
+    return parsed.records, parsed.meta.links.next
+
+
+def _client_options(api_key: str, timeout: float) -> dict[str, Any]:
+    """Keyword arguments shared by the sync and async httpx clients."""
+    return {
+        "base_url": VULTR_API_BASE,
+        "headers": {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        "timeout": timeout,
+    }
+
+
+def _create_payload(
+    name: str, data: str, record_type: str, ttl: int, priority: int
+) -> dict[str, str | int]:
+    """Build the request body for creating a record."""
+    return {
+        "name": name,
+        "type": record_type,
+        "data": data,
+        "ttl": ttl,
+        "priority": priority,
+    }
+
+
+def _update_payload(
+    name: str | None, data: str | None, ttl: int | None, priority: int | None
+) -> dict[str, str | int]:
+    """Build the request body for updating a record, with only the given fields."""
+    payload: dict[str, str | int] = {}
+    if name is not None:
+        payload["name"] = name
+    if data is not None:
+        payload["data"] = data
+    if ttl is not None:
+        payload["ttl"] = ttl
+    if priority is not None:
+        payload["priority"] = priority
+    return payload
+
+
+def _updated_record(existing: DNSRecord, data: str, ttl: int) -> DNSRecord:
+    """Get the record as it is after updating its data and TTL."""
+    return msgspec.structs.replace(existing, data=data, ttl=ttl)
+
+
 class VultrClient:
     """Client for interacting with the Vultr DNS API."""
 
-    def __init__(self, api_key: str, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30.0,
+        record_cache_ttl: float = 30.0,
+        state_path: Path | None = None,
+    ) -> None:
         """
         Initialize the Vultr API client.
 
         Args:
             api_key: Vultr API key
             timeout: Request timeout in seconds
+            record_cache_ttl: How long a domain's record index is reused by
+                get_record_by_name, in seconds (0 disables)
+            state_path: JSON file remembering the records written by
+                ensure_record across runs, so unchanged records need no API
+                call and changed ones no listing (default: not persisted)
         """
         self.api_key = api_key
         self.timeout = timeout
+        self.record_cache_ttl = record_cache_ttl
+        self.state_path = state_path
+        # "<type> <fqdn>" -> {"id", "data", "ttl", "priority"} of the record
+        self._state: dict[str, dict[str, Any]] = {}
+        self._state_lock = threading.Lock()
+        if state_path is not None:
+            stored = read_json_file(state_path) or {}
+            self._state = {k: v for k, v in stored.items() if isinstance(v, dict)}
+        # records page -> (ETag, records on the page, next page cursor)
+        self._etag_cache: dict[RecordsPageKey, tuple[str, list[DNSRecord], str]] = {}
+        # domain -> (time.monotonic() when built, (name, type) -> record)
+        self._record_index_cache: dict[str, tuple[float, RecordIndex]] = {}
+        self._record_index_locks: dict[str, threading.Lock] = {}
+        self._record_index_locks_guard = threading.Lock()
         self._client = httpx.Client(
-            base_url=VULTR_API_BASE,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=timeout,
+            **_client_options(api_key, timeout),
+            # limits/http2 must be set on the transport when one is passed in
+            transport=httpx.HTTPTransport(http2=True, limits=POOL_LIMITS, retries=2),
         )
 
     def __enter__(self) -> VultrClient:
@@ -66,21 +190,6 @@ class VultrClient:
         """Close the HTTP client."""
         self._client.close()
 
-    def _handle_response(self, response: httpx.Response) -> dict[str, object]:
-        """Handle API response and raise on errors."""
-        if response.status_code >= 400:
-            try:
-                error_data = response.json()
-                message = error_data.get("error", response.text)
-            except Exception:
-                message = response.text
-            raise VultrAPIError(response.status_code, str(message))
-
-        if response.status_code == 204:  # No content
-            return {}
-
-        return dict(response.json())
-
     def list_domains(self) -> list[DNSDomain]:
         """
         List all DNS domains in the account.
@@ -89,8 +198,7 @@ class VultrClient:
             List of DNS domains
         """
         response = self._client.get("/domains")
-        data = self._handle_response(response)
-        parsed = DNSDomainsResponse.model_validate(data)
+        parsed = _domains_decoder.decode(_check_response(response))
         return parsed.domains
 
     def list_records(self, domain: str) -> list[DNSRecord]:
@@ -103,10 +211,51 @@ class VultrClient:
         Returns:
             List of DNS records
         """
-        response = self._client.get(f"/domains/{domain}/records")
-        data = self._handle_response(response)
-        parsed = DNSRecordsResponse.model_validate(data)
-        return parsed.records
+        return list(self.iter_records(domain))
+
+    def iter_records(self, domain: str, per_page: int = RECORDS_PER_PAGE) -> Iterator[DNSRecord]:
+        """
+        Iterate over all DNS records for a domain, one API page at a time.
+
+        Pages are fetched conditionally: if the API returned an ETag for a
+        page before, it is sent back and an unchanged page (304 Not Modified)
+        is served from memory instead of being downloaded and parsed again.
+
+        Args:
+            domain: The domain name
+            per_page: Number of records to request per page
+
+        Yields:
+            DNS records, as each page is received
+        """
+        params: dict[str, str | int] = {"per_page": per_page}
+        while True:
+            records, cursor = self._get_records_page(domain, params)
+            yield from records
+
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
+    def _get_records_page(
+        self, domain: str, params: dict[str, str | int]
+    ) -> tuple[list[DNSRecord], str]:
+        """Fetch one page of a records listing, revalidating a cached copy by ETag."""
+        key: RecordsPageKey = (domain, tuple(sorted(params.items())))
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = self._client.get(f"/domains/{domain}/records", params=params, headers=headers)
+        if cached and response.status_code == 304:
+            return list(cached[1]), cached[2]
+
+        records, cursor = _parse_records_page(_check_response(response))
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[key] = (etag, records, cursor)
+        else:
+            self._etag_cache.pop(key, None)
+        return list(records), cursor
 
     def get_record_by_name(
         self,
@@ -125,11 +274,29 @@ class VultrClient:
         Returns:
             The DNS record if found, None otherwise
         """
-        records = self.list_records(domain)
-        for record in records:
-            if record.name == name and record.type == record_type:
-                return record
-        return None
+        return self._record_index(domain).get((name, record_type))
+
+    def _record_index(self, domain: str) -> RecordIndex:
+        """Get the (name, type) -> record index for a domain, listing it if stale."""
+        with self._record_index_locks_guard:
+            lock = self._record_index_locks.setdefault(domain, threading.Lock())
+
+        # Per-domain lock: concurrent lookups in one domain share a single listing
+        with lock:
+            cached = self._record_index_cache.get(domain)
+            if cached is not None and time.monotonic() - cached[0] < self.record_cache_ttl:
+                return cached[1]
+
+            index: RecordIndex = {}
+            for record in self.list_records(domain):
+                # First match wins if the zone has duplicates
+                index.setdefault((record.name, record.type), record)
+            self._record_index_cache[domain] = (time.monotonic(), index)
+            return index
+
+    def _invalidate_record_index(self, domain: str) -> None:
+        """Drop the cached record index for a domain after it was modified."""
+        self._record_index_cache.pop(domain, None)
 
     def create_record(
         self,
@@ -154,16 +321,10 @@ class VultrClient:
         Returns:
             The created DNS record
         """
-        payload = {
-            "name": name,
-            "type": record_type,
-            "data": data,
-            "ttl": ttl,
-            "priority": priority,
-        }
+        payload = _create_payload(name, data, record_type, ttl, priority)
         response = self._client.post(f"/domains/{domain}/records", json=payload)
-        resp_data = self._handle_response(response)
-        parsed = DNSRecordResponse.model_validate(resp_data)
+        self._invalidate_record_index(domain)
+        parsed = _record_decoder.decode(_check_response(response))
         return parsed.record
 
     def update_record(
@@ -186,21 +347,13 @@ class VultrClient:
             ttl: New TTL (optional)
             priority: New priority (optional)
         """
-        payload: dict[str, str | int] = {}
-        if name is not None:
-            payload["name"] = name
-        if data is not None:
-            payload["data"] = data
-        if ttl is not None:
-            payload["ttl"] = ttl
-        if priority is not None:
-            payload["priority"] = priority
-
+        payload = _update_payload(name, data, ttl, priority)
         response = self._client.patch(
             f"/domains/{domain}/records/{record_id}",
             json=payload,
         )
-        self._handle_response(response)
+        self._invalidate_record_index(domain)
+        _check_response(response)
 
     def delete_record(self, domain: str, record_id: str) -> None:
         """
@@ -211,7 +364,15 @@ class VultrClient:
             record_id: The record ID
         """
         response = self._client.delete(f"/domains/{domain}/records/{record_id}")
-        self._handle_response(response)
+        self._invalidate_record_index(domain)
+        _check_response(response)
+
+        with self._state_lock:
+            stale = [key for key, entry in self._state.items() if entry.get("id") == record_id]
+            for key in stale:
+                del self._state[key]
+        if stale:
+            self._save_state()
 
     def ensure_record(
         self,
@@ -238,26 +399,293 @@ class VultrClient:
         Returns:
             Tuple of (record, was_changed)
         """
-        existing = self.get_record_by_name(domain, name, record_type)
-
-        if existing is None:
-            # Create new record
-            record = self.create_record(domain, name, data, record_type, ttl)
-            return record, True
-
-        if existing.data == data and existing.ttl == ttl and not force:
-            # No change needed
-            return existing, False
-
-        # Update existing record
-        self.update_record(domain, existing.id, data=data, ttl=ttl)
-        # Return updated record info
-        updated = DNSRecord(
-            id=existing.id,
-            type=existing.type,
-            name=existing.name,
-            data=data,
-            priority=existing.priority,
-            ttl=ttl,
+        return self.ensure_records_bulk(domain, [(name, data, record_type, ttl)], force=force)[0]
+
+    def ensure_records_bulk(
+        self,
+        domain: str,
+        specs: list[tuple[str, str, str, int]],
+        force: bool = False,
+    ) -> list[tuple[DNSRecord, bool]]:
+        """
+        Ensure several DNS records of one domain exist with the specified data.
+
+        The domain's records are listed once and every spec is checked against
+        that listing, instead of one listing per record. With a state_path,
+        records remembered from earlier runs skip the listing: unchanged ones
+        are returned without any API call and changed ones are patched
+        directly, falling back to the listing if the record was deleted.
+
+        Args:
+            domain: The domain name
+            specs: (name, data, record_type, ttl) for each record
+            force: Force update even if data matches (default: False)
+
+        Returns:
+            List of (record, was_changed), in the same order as specs
+        """
+        index: RecordIndex | None = None
+        results: list[tuple[DNSRecord, bool]] = []
+
+        for name, data, record_type, ttl in specs:
+            remembered = self._remembered_record(domain, name, record_type)
+
+            if remembered is not None:
+                if remembered.data == data and remembered.ttl == ttl and not force:
+                    results.append((remembered, False))
+                    continue
+
+                try:
+                    self.update_record(domain, remembered.id, data=data, ttl=ttl)
+                except VultrAPIError as e:
+                    if e.status_code != 404:
+                        raise
+                    # Deleted since it was remembered; look it up again below
+                else:
+                    updated = _updated_record(remembered, data, ttl)
+                    self._remember_record(domain, updated)
+                    results.append((updated, True))
+                    continue
+
+            if index is None:
+                # Copy, since writes below invalidate the shared cached index
+                index = dict(self._record_index(domain))
+            existing = index.get((name, record_type))
+
+            if existing is None:
+                # Create new record
+                record = self.create_record(domain, name, data, record_type, ttl)
+                index[(name, record_type)] = record
+                self._remember_record(domain, record)
+                results.append((record, True))
+                continue
+
+            if existing.data == data and existing.ttl == ttl and not force:
+                # No change needed
+                self._remember_record(domain, existing)
+                results.append((existing, False))
+                continue
+
+            # Update existing record
+            self.update_record(domain, existing.id, data=data, ttl=ttl)
+            # Return updated record info
+            updated = _updated_record(existing, data, ttl)
+            index[(name, record_type)] = updated
+            self._remember_record(domain, updated)
+            results.append((updated, True))
+
+        return results
+
+    @staticmethod
+    def _state_key(domain: str, name: str, record_type: str) -> str:
+        fqdn = f"{name}.{domain}" if name else domain
+        return f"{record_type} {fqdn}"
+
+    def _remembered_record(self, domain: str, name: str, record_type: str) -> DNSRecord | None:
+        """Get the record as last written by ensure_record, if remembered."""
+        if self.state_path is None:
+            return None
+        with self._state_lock:
+            entry = self._state.get(self._state_key(domain, name, record_type))
+        if entry is None:
+            return None
+        try:
+            return msgspec.convert({**entry, "type": record_type, "name": name}, type=DNSRecord)
+        except msgspec.ValidationError:  # Malformed entry; ignore it
+            return None
+
+    def _remember_record(self, domain: str, record: DNSRecord) -> None:
+        """Remember a record's current state and persist it."""
+        if self.state_path is None:
+            return
+        entry = {
+            "id": record.id,
+            "data": record.data,
+            "ttl": record.ttl,
+            "priority": record.priority,
+        }
+        key = self._state_key(domain, record.name, record.type)
+        with self._state_lock:
+            if self._state.get(key) == entry:
+                return
+            self._state[key] = entry
+        self._save_state()
+
+    def _save_state(self) -> None:
+        """Atomically write the remembered records to state_path."""
+        if self.state_path is None:
+            return
+        with self._state_lock:
+            write_json_file(self.state_path, dict(self._state))
+
+
+class AsyncVultrClient:
+    """Asynchronous client for writing Vultr DNS records concurrently.
+
+    Covers only listing, creating and updating records, plus
+    ensure_records_bulk, which sends a zone's independent writes concurrently
+    over a single HTTP/2 connection. Unlike VultrClient it has no record
+    index, state_path, domain listing or deletion.
+    """
+
+    def __init__(self, api_key: str, timeout: float = 30.0) -> None:
+        """
+        Initialize the asynchronous Vultr API client.
+
+        Args:
+            api_key: Vultr API key
+            timeout: Request timeout in seconds
+        """
+        self.api_key = api_key
+        self.timeout = timeout
+        self._client = httpx.AsyncClient(
+            **_client_options(api_key, timeout),
+            # limits/http2 must be set on the transport when one is passed in
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=POOL_LIMITS, retries=2),
+        )
+
+    async def __aenter__(self) -> AsyncVultrClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def list_records(self, domain: str) -> list[DNSRecord]:
+        """
+        List all DNS records for a domain.
+
+        Args:
+            domain: The domain name
+
+        Returns:
+            List of DNS records
+        """
+        return [record async for record in self.iter_records(domain)]
+
+    async def iter_records(
+        self, domain: str, per_page: int = RECORDS_PER_PAGE
+    ) -> AsyncIterator[DNSRecord]:
+        """
+        Iterate over all DNS records for a domain, one API page at a time.
+
+        Args:
+            domain: The domain name
+            per_page: Number of records to request per page
+
+        Yields:
+            DNS records, as each page is received
+        """
+        params: dict[str, str | int] = {"per_page": per_page}
+        while True:
+            response = await self._client.get(f"/domains/{domain}/records", params=params)
+            records, cursor = _parse_records_page(_check_response(response))
+            for record in records:
+                yield record
+
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
+    async def create_record(
+        self,
+        domain: str,
+        name: str,
+        data: str,
+        record_type: str = "A",
+        ttl: int = 300,
+        priority: int = 0,
+    ) -> DNSRecord:
+        """
+        Create a new DNS record.
+
+        Args:
+            domain: The domain name
+            name: The record name (subdomain)
+            data: The record data (e.g., IP address)
+            record_type: The record type (default: A)
+            ttl: Time to live in seconds (default: 300)
+            priority: Record priority (default: 0)
+
+        Returns:
+            The created DNS record
+        """
+        payload = _create_payload(name, data, record_type, ttl, priority)
+        response = await self._client.post(f"/domains/{domain}/records", json=payload)
+        parsed = _record_decoder.decode(_check_response(response))
+        return parsed.record
+
+    async def update_record(
+        self,
+        domain: str,
+        record_id: str,
+        name: str | None = None,
+        data: str | None = None,
+        ttl: int | None = None,
+        priority: int | None = None,
+    ) -> None:
+        """
+        Update an existing DNS record.
+
+        Args:
+            domain: The domain name
+            record_id: The record ID
+            name: New record name (optional)
+            data: New record data (optional)
+            ttl: New TTL (optional)
+            priority: New priority (optional)
+        """
+        payload = _update_payload(name, data, ttl, priority)
+        response = await self._client.patch(
+            f"/domains/{domain}/records/{record_id}",
+            json=payload,
         )
-        return updated, True
+        _check_response(response)
+
+    async def ensure_records_bulk(
+        self,
+        domain: str,
+        specs: list[tuple[str, str, str, int]],
+        force: bool = False,
+    ) -> list[tuple[DNSRecord, bool]]:
+        """
+        Ensure several DNS records of one domain exist with the specified data.
+
+        The domain is listed once, then all needed creates/updates are sent
+        concurrently. Specs should name distinct records.
+
+        Args:
+            domain: The domain name
+            specs: (name, data, record_type, ttl) for each record
+            force: Force update even if data matches (default: False)
+
+        Returns:
+            List of (record, was_changed), in the same order as specs
+        """
+        index: RecordIndex = {}
+        async for record in self.iter_records(domain):
+            # First match wins if the zone has duplicates
+            index.setdefault((record.name, record.type), record)
+
+        async def ensure(spec: tuple[str, str, str, int]) -> tuple[DNSRecord, bool]:
+            name, data, record_type, ttl = spec
+            existing = index.get((name, record_type))
+
+            if existing is None:
+                return await self.create_record(domain, name, data, record_type, ttl), True
+
+            if existing.data == data and existing.ttl == ttl and not force:
+                return existing, False
+
+            await self.update_record(domain, existing.id, data=data, ttl=ttl)
+            return _updated_record(existing, data, ttl), True
+
+        return list(await asyncio.gather(*(ensure(spec) for spec in specs)))